@@ -7,14 +7,14 @@ with the ability to interject once per round for dramatic moments.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from enum import Enum
 import logging
 
 class TurnType(Enum):
     STANDARD = "standard"
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     """A single turn in the conversation"""
     speaker: str
@@ -25,7 +25,7 @@ class Turn:
     tone: Optional[str] = None     # Emotional tone
     target: Optional[str] = None  # Who they're targeting to speak next
 
-@dataclass
+@dataclass(slots=True)
 class ConversationState:
     """Current state of the conversation"""
     current_round: int = 1
@@ -34,7 +34,7 @@ class ConversationState:
     exit_requests: Dict[str, bool] = field(default_factory=dict)
     conversation_energy: str = "high"  # high, medium, low
     forced_exit_round: int = 8  # Must exit by this round
-    speakers_this_round: List[str] = field(default_factory=list)  # Track who has spoken this round
+    speakers_this_round: Set[str] = field(default_factory=set)  # Track who has spoken this round
     turns_this_round: Dict[str, int] = field(default_factory=dict)  # Track turn count per character this round
     interjections_this_round: Dict[str, bool] = field(default_factory=dict)  # Track who has interjected this round
 
@@ -43,6 +43,7 @@ class ConversationManager:
     
     def __init__(self, characters: List[str]):
         self.characters = characters
+        self._character_set = set(characters)  # For O(1) round-completion checks
         self.state = ConversationState()
         self.logger = logging.getLogger(__name__)
         
@@ -66,7 +67,13 @@ class ConversationManager:
         
         self.logger.info(f"🔄 Rotation speaker (index {self.speaker_index-1}): {speaker}")
         return speaker
-        
+
+    def peek_next_speaker(self) -> str:
+        """Preview the next speaker without consuming the override or rotation"""
+        if self.next_speaker_override:
+            return self.next_speaker_override
+        return self.characters[self.speaker_index % len(self.characters)]
+
     def set_next_speaker_from_target(self, target_name: str, current_speaker: str):
         """Set the next speaker based on conversation target (like mafia.py)"""
         if target_name and target_name in self.characters and target_name != current_speaker:
@@ -93,35 +100,34 @@ class ConversationManager:
     def add_turn(self, speaker: str, content: str, action: Optional[str] = None, 
                 tone: Optional[str] = None, target: Optional[str] = None) -> Turn:
         """Add a turn to the conversation history"""
-        
+        state = self.state  # Bind once - this method touches it constantly
+
         # Log Round 1 on the very first turn
-        if self.state.current_turn == 0:
-            self.logger.info(f"")
-            self.logger.info(f"{'='*50}")
-            self.logger.info(f"ROUND {self.state.current_round}")
-            self.logger.info(f"{'='*50}")
-            
+        if state.current_turn == 0:
+            self._announce_round()
+
+
         turn = Turn(
             speaker=speaker,
             type=TurnType.STANDARD,
-            round_number=self.state.current_round,
+            round_number=state.current_round,
             content=content,
             action=action,
             tone=tone,
             target=target
         )
-        self.state.turns_taken.append(turn)
-        self.state.current_turn += 1
-        
+        state.turns_taken.append(turn)
+        state.current_turn += 1
+
         # Track that this speaker has spoken this round
-        if speaker not in self.state.speakers_this_round:
-            self.state.speakers_this_round.append(speaker)
-            
+        state.speakers_this_round.add(speaker)
+
+
         # Track turn count per character this round
-        self.state.turns_this_round[speaker] = self.state.turns_this_round.get(speaker, 0) + 1
-        turns_count = self.state.turns_this_round[speaker]
-        
-        self.logger.info(f"Turn {self.state.current_turn}: {speaker} in round {self.state.current_round} (turn {turns_count}/2 for this character this round)")
+        turns_count = state.turns_this_round.get(speaker, 0) + 1
+        state.turns_this_round[speaker] = turns_count
+
+        self.logger.info(f"Turn {state.current_turn}: {speaker} in round {state.current_round} (turn {turns_count}/2 for this character this round)")
         
         # Handle targeting
         if target:
@@ -145,7 +151,7 @@ class ConversationManager:
             
         # Also advance if everyone has spoken at least once (traditional rule)
         # This allows shorter rounds if natural conversation lulls
-        all_have_spoken = set(self.state.speakers_this_round) == set(self.characters)
+        all_have_spoken = self.state.speakers_this_round == self._character_set
         return all_have_spoken
         
     def can_interject(self, character: str) -> bool:
@@ -157,18 +163,21 @@ class ConversationManager:
         self.state.interjections_this_round[character] = True
         self.logger.info(f"🎯 {character} has used their interjection for round {self.state.current_round}")
         
-    def start_new_round(self):
-        """Start a new conversation round"""
-        self.state.current_round += 1
-        
-        # Add prominent round announcement like character announcements
+    def _announce_round(self):
+        """Log a prominent round banner like character announcements"""
         self.logger.info(f"")
         self.logger.info(f"{'='*50}")
         self.logger.info(f"ROUND {self.state.current_round}")
         self.logger.info(f"{'='*50}")
-        
+
+    def start_new_round(self):
+        """Start a new conversation round"""
+        self.state.current_round += 1
+        self._announce_round()
+
+
         # Reset round tracking
-        self.state.speakers_this_round = []
+        self.state.speakers_this_round = set()
         self.state.turns_this_round = {}  # Reset turn counts per character
         self.state.interjections_this_round = {}
         
@@ -230,12 +239,13 @@ class ConversationManager:
         """Get statistics about the conversation"""
         stats = {
             "total_turns": len(self.state.turns_taken),
-            "turns_by_character": {},
+            "turns_by_character": {char: 0 for char in self.characters},
             "rounds_completed": self.state.current_round - 1
         }
-        
-        for char in self.characters:
-            char_turns = [t for t in self.state.turns_taken if t.speaker == char]
-            stats["turns_by_character"][char] = len(char_turns)
-            
+
+        # Tally in a single pass instead of one list build per character
+        for turn in self.state.turns_taken:
+            if turn.speaker in stats["turns_by_character"]:
+                stats["turns_by_character"][turn.speaker] += 1
+
         return stats
\ No newline at end of file
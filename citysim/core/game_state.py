@@ -145,8 +145,12 @@ class GameState:
             "metadata": self.metadata
         }
         
-        with open(self.save_file, 'w') as f:
+        # Write to a temp file then atomically replace so a crash
+        # mid-write can't leave a truncated save behind
+        tmp_file = self.save_file + ".tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(state_dict, f, indent=2)
+        os.replace(tmp_file, self.save_file)
             
     def load_state(self) -> bool:
         """Load state from disk. Returns True if successful."""
@@ -205,7 +209,12 @@ class GameState:
         lines.append(f"# {self.story.title}")
         lines.append(f"Duration: {self.story.total_days} days")
         lines.append("")
-        
+
+        # Group beats by scene once instead of rescanning all beats per scene
+        beats_by_scene: Dict[int, List[Beat]] = {}
+        for beat in self.story.beats:
+            beats_by_scene.setdefault(beat.scene_number, []).append(beat)
+
         for scene in self.story.scenes:
             lines.append(f"## Scene {scene.number}: {scene.title}")
             lines.append(f"Premise: {scene.premise}")
@@ -215,8 +224,7 @@ class GameState:
             lines.append("")
             
             # Add beats for this scene
-            scene_beats = [b for b in self.story.beats if b.scene_number == scene.number]
-            for beat in scene_beats:
+            for beat in beats_by_scene.get(scene.number, []):
                 lines.append(f"### Beat {beat.number}: {beat.situation}")
                 lines.append(f"Location: {beat.location}, Time: {beat.time}")
                 lines.append(f"Characters: {', '.join(beat.characters)}")
@@ -7,8 +7,11 @@ set up beats, and manage the village simulator.
 """
 
 import asyncio
+import atexit
+import queue
 import sys
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 from .scene_director import SceneDirector, BeatSetup
 
@@ -19,12 +22,20 @@ class CLIInterface:
         self.director = SceneDirector()
         self.logger = logging.getLogger(__name__)
         
-        # Setup logging for CLI
+        # Setup logging for CLI - log records go through an in-memory
+        # queue so the flush-per-record file writes happen on a listener
+        # thread instead of blocking the conversation loop
+        log_queue: queue.Queue = queue.Queue(-1)
+        file_handler = logging.FileHandler('logs/session.log')
+        file_handler.setFormatter(logging.Formatter('%(levelname)-7s | %(message)s'))
+        self._log_listener = QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+
         logging.basicConfig(
             level=logging.INFO,
-            format='%(levelname)-7s | %(message)s',
             handlers=[
-                logging.FileHandler('logs/session.log'),
+                QueueHandler(log_queue),
             ]
         )
         
@@ -60,6 +71,8 @@ class CLIInterface:
             choice = input("Enter choice (0-10): ").strip()
             
             if choice == "0":
+                self.director.flush_saves()  # Make sure queued auto-saves land
+                await self.director.llm_interface.close()  # Release HTTP connections
                 print("👋 Goodbye!")
                 break
             elif choice == "1":
@@ -252,15 +265,19 @@ class CLIInterface:
         summary = self.director.get_scene_summary()
         npc_status = summary["npc_status"]
         
+        # Build the whole report and write it in one call instead of a
+        # flush-per-line print loop
+        lines = []
         for char, status in npc_status.items():
-            print(f"{char}:")
-            print(f"  Primary trait: {status['primary_trait']}")
-            print(f"  Confidence: {status['confidence']}/10")
-            print(f"  Emotional state: {status['emotional_state']}")
-            print(f"  Emotional intensity: {status['emotional_intensity']}/10")
-            print(f"  Wants to exit: {status['wants_to_exit']}")
-            print(f"  Has complication: {status['current_complication']}")
-            print()
+            lines.append(f"{char}:")
+            lines.append(f"  Primary trait: {status['primary_trait']}")
+            lines.append(f"  Confidence: {status['confidence']}/10")
+            lines.append(f"  Emotional state: {status['emotional_state']}")
+            lines.append(f"  Emotional intensity: {status['emotional_intensity']}/10")
+            lines.append(f"  Wants to exit: {status['wants_to_exit']}")
+            lines.append(f"  Has complication: {status['current_complication']}")
+            lines.append("")
+        print("\n".join(lines))
             
     def view_relationships(self):
         """Display relationship matrix"""
@@ -274,23 +291,26 @@ class CLIInterface:
             print("No established relationships yet.")
             return
             
+        # Build the whole matrix and write it in one call
+        lines = []
         for from_char, relations in relationships.items():
-            print(f"{from_char} feels about others:")
+            lines.append(f"{from_char} feels about others:")
             for to_char, rel in relations.items():
                 trust = rel.get("trust", "?")
                 affection = rel.get("affection", "?")
                 label = rel.get("label", "unknown")
-                print(f"  {to_char}: {label} (Trust:{trust}/10, Affection:{affection}/10)")
-            print()
-            
+                lines.append(f"  {to_char}: {label} (Trust:{trust}/10, Affection:{affection}/10)")
+            lines.append("")
+
         # Show asymmetries
         asymmetries = self.director.npc_manager.get_relationship_asymmetries()
         if asymmetries:
-            print("🔀 RELATIONSHIP ASYMMETRIES:")
+            lines.append("🔀 RELATIONSHIP ASYMMETRIES:")
             for asym in asymmetries[:3]:  # Top 3
                 c1, c2 = asym["char1"], asym["char2"]
                 gap = max(asym["trust_gap"], asym["affection_gap"])
-                print(f"  {c1} ↔ {c2}: {gap} point difference in feelings")
+                lines.append(f"  {c1} ↔ {c2}: {gap} point difference in feelings")
+        print("\n".join(lines))
                 
     def view_relationship_file(self):
         """Display the location and contents of the relationship file"""
@@ -447,8 +467,10 @@ def main():
     try:
         asyncio.run(cli.run())
     except KeyboardInterrupt:
+        cli.director.flush_saves()
         print("\n\n👋 Interrupted by user. Goodbye!")
     except Exception as e:
+        cli.director.flush_saves()
         print(f"\n❌ Fatal error: {e}")
         sys.exit(1)
 
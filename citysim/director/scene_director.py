@@ -10,13 +10,21 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 import asyncio
+import atexit
 import os
+import queue
+import threading
 
 from ..core.game_state import GameState, Scene, Beat
 from ..core.conversation_manager import ConversationManager
 from ..npc.npc_manager import NPCManager
 from ..prompts.llm_interface import LLMInterface
 
+# How many recent turns go into each prompt. LLM latency and token cost
+# scale with prompt length, and turns older than this add little beyond
+# what the beat situation already establishes
+RECENT_TURNS_WINDOW = 12
+
 @dataclass
 class BeatSetup:
     """Configuration for a beat"""
@@ -30,11 +38,12 @@ class BeatSetup:
 class SceneDirector:
     """Main interface for directing scenes and managing NPCs"""
     
-    def __init__(self, characters: List[str] = None):
+    def __init__(self, characters: List[str] = None, human_pacing: bool = False):
         if characters is None:
             characters = ["Alice", "Bob", "Charlie"]
-            
+
         self.characters = characters
+        self.human_pacing = human_pacing  # Pause between turns for human readability
         self.game_state = GameState()
         self.llm_interface = LLMInterface()
         self.logger = logging.getLogger(__name__)
@@ -42,18 +51,49 @@ class SceneDirector:
         # Current scene/beat management
         self.current_conversation: Optional[ConversationManager] = None
         self.beat_events: List[str] = []
+
+        # Incrementally maintained prompt-ready turn history - appended to
+        # once per turn instead of re-serializing every turn on each
+        # context build (which was O(turns^2) over a beat)
+        self._serialized_turns: List[Dict[str, Any]] = []
+
+        # Default speaking target per character - depends only on the
+        # beat's cast, so it is computed once per beat
+        self._default_targets: Dict[str, str] = {}
+
+        # Scene context block for prompts - invariant for the whole beat
+        self._scene_context: Dict[str, str] = {
+            "premise": "Unknown situation",
+            "stakes": "Unknown consequences"
+        }
+
+        # Prefetch pipeline - next speaker's LLM request started while the
+        # current turn is still being logged/printed
+        self._prefetch_task: Optional[asyncio.Task] = None
+        self._prefetch_speaker: Optional[str] = None
         
         # Auto-load/save NPC data (including relationships)
         self.npc_data_file = "saves/npc_data.json"
+        fresh_start = not os.path.exists(self.npc_data_file)
         self.npc_manager = NPCManager.load_from_file(self.npc_data_file, characters)
-        
-        # Establish first meetings if this is a fresh start
-        if not os.path.exists(self.npc_data_file):
+
+        # Establish first meetings and save so the file exists on a fresh
+        # start; an existing file was just loaded, so re-writing the same
+        # data back would be a redundant serialize + disk write
+        if fresh_start:
             self.npc_manager.establish_first_meetings()
-            
-        # Always save after initialization to ensure file exists
-        self.npc_manager.save_to_file(self.npc_data_file)
-        
+            self.npc_manager.save_to_file(self.npc_data_file)
+
+        # Background writer for auto-saves so disk I/O never blocks the
+        # conversation loop; snapshots are taken on the main thread
+        self._save_queue: queue.Queue = queue.Queue()
+        self._save_worker = threading.Thread(target=self._drain_save_queue, daemon=True)
+        self._save_worker.start()
+        # Drain pending saves at interpreter exit too - daemon threads are
+        # killed at teardown, and Ctrl-C out of the REPL must not drop the
+        # last beat's relationship snapshot
+        atexit.register(self.flush_saves)
+
         self.logger.info(f"SceneDirector initialized with {len(characters)} characters")
         self.logger.info(f"NPC data auto-saved to: {self.npc_data_file}")
         
@@ -111,7 +151,20 @@ class SceneDirector:
             
         # Initialize conversation manager
         self.current_conversation = ConversationManager(current_beat.characters)
-        
+        self._serialized_turns = []
+        self._default_targets = {
+            char: next((c for c in current_beat.characters if c != char), char)
+            for char in current_beat.characters
+        }
+
+        # The scene can't change mid-beat - resolve it once here instead
+        # of on every turn's context build
+        current_scene = self.game_state.get_current_scene()
+        self._scene_context = {
+            "premise": current_scene.premise if current_scene else "Unknown situation",
+            "stakes": current_scene.stakes if current_scene else "Unknown consequences"
+        }
+
         conversation_log = []
         round_count = 0
         last_round = 0  # Track rounds to print when they change
@@ -137,13 +190,18 @@ class SceneDirector:
                 
                 # Get current speaker (like mafia.py)
                 speaker = self.current_conversation.get_next_speaker()
-                
-                # Generate turn context
-                turn_context = await self._build_turn_context(speaker, current_beat)
-                
-                # Generate NPC response
-                turn_result = await self.llm_interface.generate_npc_turn(turn_context)
-                
+
+                # Use the prefetched response if it was for this speaker
+                if self._prefetch_task and self._prefetch_speaker == speaker:
+                    turn_result = await self._prefetch_task
+                else:
+                    if self._prefetch_task:
+                        self._prefetch_task.cancel()
+                    turn_context = await self._build_turn_context(speaker, current_beat)
+                    turn_result = await self.llm_interface.generate_npc_turn(turn_context)
+                self._prefetch_task = None
+                self._prefetch_speaker = None
+
                 if turn_result and turn_result["action"]["speaks"]:
                     speaks = turn_result["action"]["speaks"]
                     tone = turn_result["action"]["tone"]
@@ -165,8 +223,27 @@ class SceneDirector:
                     
                     # Update NPC state
                     self.npc_manager.process_turn_result(speaker, turn_result)
-                    
-                    # Add to conversation log and beat events  
+
+                    # Extend the prompt-ready turn history incrementally
+                    self._serialized_turns.append({
+                        "speaker": speaker,
+                        "content": speaks,
+                        "tone": tone,
+                        "action": action
+                    })
+
+                    # Kick off the next speaker's LLM request now so model
+                    # generation overlaps the logging/printing below
+                    should_end, _ = self.current_conversation.should_end_conversation()
+                    if not should_end:
+                        next_speaker = self.current_conversation.peek_next_speaker()
+                        next_context = await self._build_turn_context(next_speaker, current_beat)
+                        self._prefetch_task = asyncio.create_task(
+                            self.llm_interface.generate_npc_turn(next_context)
+                        )
+                        self._prefetch_speaker = next_speaker
+
+                    # Add to conversation log and beat events
                     log_entry = {
                         "turn": turn_num + 1,
                         "round": self.current_conversation.state.current_round,
@@ -179,21 +256,23 @@ class SceneDirector:
                         "wants_to_exit": turn_result["internal"].get("wants_to_exit", False)
                     }
                     conversation_log.append(log_entry)
-                    
-                    event_desc = f"{speaker}: \"{speaks}\""
-                    if action:
-                        event_desc += f" ({action})"
-                    self.beat_events.append(event_desc)
-                    
+
                 else:
                     self.logger.info(f"⏭️  {speaker} skipped turn - null message")
                     
-                await asyncio.sleep(0.5)  # Brief pause between turns
+                if self.human_pacing:
+                    await asyncio.sleep(0.5)  # Brief pause between turns for readability
                     
         except Exception as e:
             self.logger.error(f"Error during beat conversation: {e}")
             raise
-            
+        finally:
+            # Discard any prefetched turn that was never consumed
+            if self._prefetch_task:
+                self._prefetch_task.cancel()
+                self._prefetch_task = None
+                self._prefetch_speaker = None
+
         # End beat and process reflections
         await self._complete_beat(conversation_log)
         
@@ -217,9 +296,6 @@ class SceneDirector:
             }
         )
         
-        # Get current scene and beat
-        current_scene = self.game_state.get_current_scene()
-        
         # Build conversation context - get all turns from this beat
         beat_turns = self.current_conversation.get_all_beat_turns() if self.current_conversation else []
         last_turn = beat_turns[-1] if beat_turns else None
@@ -227,14 +303,7 @@ class SceneDirector:
         conversation_context = {
             "current_round": self.current_conversation.state.current_round if self.current_conversation else 1,
             "energy": self.current_conversation.state.conversation_energy if self.current_conversation else "high",
-            "recent_turns": [
-                {
-                    "speaker": t.speaker,
-                    "content": t.content,
-                    "tone": t.tone,
-                    "action": t.action
-                } for t in beat_turns
-            ]
+            "recent_turns": self._serialized_turns[-RECENT_TURNS_WINDOW:]
         }
         
         if last_turn and last_turn.speaker != speaker:
@@ -250,10 +319,7 @@ class SceneDirector:
             "scenario": npc_context["scenario"],
             "relationship": npc_context["relationship"],
             "conversation": conversation_context,
-            "scene": {
-                "premise": current_scene.premise if current_scene else "Unknown situation",
-                "stakes": current_scene.stakes if current_scene else "Unknown consequences"
-            },
+            "scene": self._scene_context,
             "beat": {
                 "number": beat.number,
                 "situation": beat.situation,
@@ -266,34 +332,84 @@ class SceneDirector:
     def _determine_speaking_target(self, speaker: str, characters: List[str]) -> str:
         """Determine who the speaker is primarily addressing"""
         # For now, simple logic - address the group or first other character
+        target = self._default_targets.get(speaker)
+        if target is not None:
+            return target
+        # Fallback for calls outside an active beat conversation
         others = [c for c in characters if c != speaker]
         return others[0] if others else speaker
         
     async def _complete_beat(self, conversation_log: List[Dict[str, Any]]):
         """Complete the beat and process reflections"""
         current_beat = self.game_state.get_current_beat()
-        
-        # Generate reflections for each character
-        for character in current_beat.characters:
-            reflection_context = await self._build_reflection_context(character, conversation_log)
-            reflection = await self.llm_interface.generate_beat_reflection(reflection_context)
-            
-            # Process the reflection to update relationships and knowledge
+
+        # Materialize the readable event log once at beat end rather than
+        # building f-strings inside the turn loop
+        self.beat_events = [
+            f"{entry['speaker']}: \"{entry['content']}\"" +
+            (f" ({entry['action']})" if entry['action'] else "")
+            for entry in conversation_log
+        ]
+
+
+        # Generate reflections for all characters concurrently - each
+        # reflection only reads beat state, so the LLM calls can overlap
+        reflection_contexts = [
+            await self._build_reflection_context(character, conversation_log, current_beat)
+            for character in current_beat.characters
+        ]
+        # Try one combined call first - the shared beat context is then
+        # processed once instead of once per character
+        batch = await self.llm_interface.generate_batch_reflections(reflection_contexts)
+        if batch is not None:
+            reflections = [batch[char] for char in current_beat.characters]
+        else:
+            reflections = await asyncio.gather(*(
+                self.llm_interface.generate_beat_reflection(context)
+                for context in reflection_contexts
+            ), return_exceptions=True)
+
+        # Apply results serially - relationship updates mutate shared
+        # state, and one character's failure shouldn't lose the others
+        for character, reflection in zip(current_beat.characters, reflections):
+            if isinstance(reflection, Exception):
+                self.logger.error(f"Reflection failed for {character}: {reflection}")
+                continue
             self.npc_manager.process_beat_reflection(character, reflection)
-            
+
+
         # Mark beat as completed
         outcome = f"Conversation completed after {len(conversation_log)} turns"
         self.game_state.complete_beat(outcome)
         
         # Auto-save NPC data after beat completion (relationships updated)
-        self.npc_manager.save_to_file(self.npc_data_file)
+        self._queue_npc_save()
         self.logger.info(f"Beat {current_beat.number} completed with {len(conversation_log)} total turns")
         self.logger.info(f"NPC relationships auto-saved to: {self.npc_data_file}")
         
-    async def _build_reflection_context(self, character: str, conversation_log: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Build context for beat reflection"""
-        current_beat = self.game_state.get_current_beat()
-        
+    def _queue_npc_save(self):
+        """Snapshot NPC data on the main thread and hand it to the writer"""
+        self._save_queue.put((self.npc_manager.to_dict(), self.npc_data_file))
+
+    def _drain_save_queue(self):
+        """Background thread: write queued NPC snapshots to disk"""
+        while True:
+            data, filepath = self._save_queue.get()
+            try:
+                NPCManager.write_data(data, filepath)
+            except Exception as e:
+                self.logger.warning(f"Background NPC save failed: {e}")
+            finally:
+                self._save_queue.task_done()
+
+    def flush_saves(self):
+        """Block until all queued auto-saves have hit disk"""
+        self._save_queue.join()
+
+    async def _build_reflection_context(self, character: str, conversation_log: List[Dict[str, Any]],
+                                        current_beat: Beat) -> Dict[str, Any]:
+        """Build context for beat reflection (beat passed in - it is
+        shared by every character reflecting on the same beat)"""
         # Get character's personal context
         npc_context = self.npc_manager.get_npc_context(
             character=character,
@@ -11,9 +11,20 @@ from typing import Dict, List, Any, Optional
 import logging
 
 from .personality import PersonalityManager, PersonalityGenerator
-from .relationships import RelationshipMatrix
+from .relationships import RelationshipMatrix, RelationshipStatus
 
-@dataclass
+# orjson parses and serializes JSON several times faster than the stdlib;
+# fall back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Static accusation words that can trigger a stress response; the
+# observer's own name is added per check
+STRESS_KEYWORDS = ("liar", "thief", "betrayer")
+
+@dataclass(slots=True)
 class NPCState:
     """Current state of an NPC"""
     name: str
@@ -31,6 +42,7 @@ class NPCManager:
             characters = ["Alice", "Bob", "Charlie"]
             
         self.characters = characters
+        self._lowercase_names = [(char, char.lower()) for char in characters]  # For gossip matching
         self.personalities: Dict[str, PersonalityManager] = {}
         self.relationships = RelationshipMatrix(characters)
         self.states: Dict[str, NPCState] = {}
@@ -140,7 +152,7 @@ class NPCManager:
                 if other_char in self.characters:
                     # Establish first meeting if relationship is still unknown
                     rel = self.relationships.get_relationship(character, other_char)
-                    if rel and rel.status.value == "unknown":
+                    if rel and rel.status == RelationshipStatus.UNKNOWN:
                         rel.establish_first_meeting(5, 5)  # Default neutral meeting
                         self.logger.info(f"🤝 Established first meeting: {character} -> {other_char}")
                     
@@ -157,9 +169,11 @@ class NPCManager:
             
             # Add gossip to relationships
             for gossip in knowledge.get("gossip_worthy", []):
-                # Parse gossip to find who it's about
-                for other_char in self.characters:
-                    if other_char != character and other_char.lower() in gossip.lower():
+                # Parse gossip to find who it's about - lowercase the
+                # gossip once rather than once per candidate character
+                gossip_lower = gossip.lower()
+                for other_char, other_lower in self._lowercase_names:
+                    if other_char != character and other_lower in gossip_lower:
                         self.relationships.add_gossip(character, other_char, gossip)
                         break
                         
@@ -186,15 +200,15 @@ class NPCManager:
             triggers.append("relationship_defense")
             
         # Stress response trigger
-        stress_keywords = ["liar", "thief", "betrayer", observer.lower()]
-        if any(word in statement.lower() for word in stress_keywords):
+        statement_lower = statement.lower()
+        if any(word in statement_lower for word in STRESS_KEYWORDS) or observer.lower() in statement_lower:
             if observer_personality.should_stress_response_trigger(observer_state.emotional_intensity):
                 triggers.append("stress_response")
-                
+
         # Information correction (if they know the truth)
         if observer_state.current_complication:
             # Simple check for contradictions
-            if "never" in statement.lower() or "didn't" in statement.lower():
+            if "never" in statement_lower or "didn't" in statement_lower:
                 triggers.append("information_correction")
                 
         should_interject = len(triggers) > 0
@@ -264,14 +278,27 @@ class NPCManager:
         
     def save_to_file(self, filepath: str):
         """Save all NPC data to file"""
+        self.write_data(self.to_dict(), filepath)
+
+    @staticmethod
+    def write_data(data: Dict[str, Any], filepath: str):
+        """Write an exported NPC data dictionary to disk"""
         import json
         import os
-        
+
         # Ensure directory exists
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+
+        # Write to a temp file then atomically replace so a crash
+        # mid-write can't corrupt the existing save
+        tmp_path = filepath + ".tmp"
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+        os.replace(tmp_path, filepath)
             
     @classmethod
     def load_from_file(cls, filepath: str, characters: List[str]) -> "NPCManager":
@@ -281,12 +308,17 @@ class NPCManager:
         
         if os.path.exists(filepath):
             try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    
+                if orjson is not None:
+                    with open(filepath, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(filepath, 'r') as f:
+                        data = json.load(f)
+
                 # Create new NPCManager with loaded data
                 manager = cls.__new__(cls)
                 manager.characters = data["characters"]
+                manager._lowercase_names = [(char, char.lower()) for char in manager.characters]
                 manager.logger = logging.getLogger(__name__)
                 
                 # Reconstruct personalities
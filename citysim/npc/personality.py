@@ -6,12 +6,17 @@ Nature: Permanent core traits that define the character
 Nurture: Scene-influenced behaviors and learned patterns
 """
 
+from collections import deque
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any
+from typing import Deque, List, Dict, Any
 import json
 import random
 
-@dataclass
+# Dedicated RNG instance - avoids the module-level random.* indirection
+# on every draw and keeps personality generation seedable in one place
+_rng = random.Random()
+
+@dataclass(slots=True)
 class Nature:
     """Permanent personality core - never changes"""
     core_traits: List[str]  # ["generous", "anxious", "hardworking"]
@@ -19,15 +24,22 @@ class Nature:
     stress_response: str    # "people-pleasing", "aggressive", "withdrawal"
     moral_compass: str      # "fairness-first", "loyalty-first", "pragmatic"
     
-@dataclass 
+@dataclass(slots=True)
 class Nurture:
     """Evolving personality influenced by recent events"""
     recent_treatment: str = "neutral"     # "appreciated", "dismissed", "trusted"
     current_confidence: int = 5           # 0-10 scale
-    learned_behaviors: List[str] = field(default_factory=list)  # ["Bob responds to guilt"]
-    temporary_beliefs: List[str] = field(default_factory=list)  # ["We might survive"]
+    learned_behaviors: Deque[str] = field(default_factory=lambda: deque(maxlen=5))  # ["Bob responds to guilt"]
+    temporary_beliefs: Deque[str] = field(default_factory=lambda: deque(maxlen=3))  # ["We might survive"]
     social_mask: str = "authentic"        # "competent leader", "helpful friend"
     emotional_state: str = "neutral"      # Current emotional state
+
+    def __post_init__(self):
+        # Saved data arrives as plain lists - coerce to bounded deques
+        if not isinstance(self.learned_behaviors, deque):
+            self.learned_behaviors = deque(self.learned_behaviors, maxlen=5)
+        if not isinstance(self.temporary_beliefs, deque):
+            self.temporary_beliefs = deque(self.temporary_beliefs, maxlen=3)
     
     def update_confidence(self, change: int):
         """Update confidence within bounds"""
@@ -36,18 +48,12 @@ class Nurture:
     def learn_behavior(self, behavior: str):
         """Learn a new behavior pattern"""
         if behavior not in self.learned_behaviors:
-            self.learned_behaviors.append(behavior)
-            # Keep only recent 5 behaviors
-            if len(self.learned_behaviors) > 5:
-                self.learned_behaviors.pop(0)
+            self.learned_behaviors.append(behavior)  # deque maxlen keeps recent 5
                 
     def adopt_belief(self, belief: str):
         """Adopt a temporary belief"""
         if belief not in self.temporary_beliefs:
-            self.temporary_beliefs.append(belief)
-            # Keep only recent 3 beliefs
-            if len(self.temporary_beliefs) > 3:
-                self.temporary_beliefs.pop(0)
+            self.temporary_beliefs.append(belief)  # deque maxlen keeps recent 3
 
 class PersonalityGenerator:
     """Generate personalities for NPCs"""
@@ -89,15 +95,15 @@ class PersonalityGenerator:
             )
         else:  # balanced random
             traits = []
-            traits.append(random.choice(cls.TRAIT_POOLS["positive"]))
-            traits.append(random.choice(cls.TRAIT_POOLS["negative"]))
-            traits.append(random.choice(cls.TRAIT_POOLS["neutral"]))
-            
+            traits.append(_rng.choice(cls.TRAIT_POOLS["positive"]))
+            traits.append(_rng.choice(cls.TRAIT_POOLS["negative"]))
+            traits.append(_rng.choice(cls.TRAIT_POOLS["neutral"]))
+
             return Nature(
                 core_traits=traits,
-                cognitive_style=random.choice(cls.COGNITIVE_STYLES),
-                stress_response=random.choice(cls.STRESS_RESPONSES),
-                moral_compass=random.choice(cls.MORAL_COMPASSES)
+                cognitive_style=_rng.choice(cls.COGNITIVE_STYLES),
+                stress_response=_rng.choice(cls.STRESS_RESPONSES),
+                moral_compass=_rng.choice(cls.MORAL_COMPASSES)
             )
     
     @classmethod
@@ -131,7 +137,7 @@ class PersonalityManager:
         context_parts.append(f"Emotional state: {self.nurture.emotional_state}")
         
         if self.nurture.learned_behaviors:
-            behaviors = self.nurture.learned_behaviors[-2:]  # Most recent 2
+            behaviors = list(self.nurture.learned_behaviors)[-2:]  # Most recent 2
             context_parts.append(f"Learned: {', '.join(behaviors)}")
             
         return " | ".join(context_parts)
@@ -179,10 +185,14 @@ class PersonalityManager:
         
     def to_dict(self) -> Dict[str, Any]:
         """Export personality to dictionary"""
+        nurture_dict = asdict(self.nurture)
+        # Deques aren't JSON-serializable - export as plain lists
+        nurture_dict["learned_behaviors"] = list(self.nurture.learned_behaviors)
+        nurture_dict["temporary_beliefs"] = list(self.nurture.temporary_beliefs)
         return {
             "name": self.name,
             "nature": asdict(self.nature),
-            "nurture": asdict(self.nurture)
+            "nurture": nurture_dict
         }
         
     @classmethod
@@ -6,17 +6,40 @@ Manages complex relationship dynamics where A's feelings toward B
 may be completely different from B's feelings toward A.
 """
 
+from collections import deque
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Tuple, Any
 import json
 from enum import Enum
 
+@lru_cache(maxsize=None)
+def _derive_label(trust, affection) -> str:
+    """Map a (trust, affection) pair to its 2-word label (memoized - the
+    score space is tiny and labels are re-derived on every update/decay)"""
+    if trust >= 8 and affection >= 8:
+        return "beloved friend"
+    elif trust >= 7 and affection >= 7:
+        return "trusted ally"
+    elif trust >= 7 and affection <= 3:
+        return "reliable stranger"
+    elif trust <= 3 and affection >= 7:
+        return "charming liar"
+    elif trust <= 3 and affection <= 3:
+        return "dangerous enemy"
+    elif trust >= 6 and 4 <= affection <= 6:
+        return "cautious ally"
+    elif 4 <= trust <= 6 and affection >= 7:
+        return "likeable acquaintance"
+    else:
+        return "complicated person"
+
 class RelationshipStatus(Enum):
     UNKNOWN = "unknown"      # Never met
     KNOWN = "known"          # Have interacted
     FORGOTTEN = "forgotten"  # Time has passed, memories faded
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """A one-directional relationship (A -> B)"""
     from_char: str
@@ -26,31 +49,23 @@ class Relationship:
     affection: Optional[int] = None    # 0-10: Do I enjoy their company?
     label: Optional[str] = None        # 2-word summary: "cautious ally"
     last_interaction: Optional[str] = None
-    historical_events: List[str] = field(default_factory=list)
-    gossip_knowledge: List[str] = field(default_factory=list)
-    
+    historical_events: Deque[str] = field(default_factory=lambda: deque(maxlen=5))
+    gossip_knowledge: Deque[str] = field(default_factory=lambda: deque(maxlen=3))
+
+    def __post_init__(self):
+        # Saved data arrives as plain lists - coerce to bounded deques so
+        # append stays O(1) with no manual truncation copies
+        if not isinstance(self.historical_events, deque):
+            self.historical_events = deque(self.historical_events, maxlen=5)
+        if not isinstance(self.gossip_knowledge, deque):
+            self.gossip_knowledge = deque(self.gossip_knowledge, maxlen=3)
+
     def derive_label(self) -> str:
         """Derive 2-word relationship label from trust/affection"""
         if self.trust is None or self.affection is None:
             return "unknown person"
-            
-        if self.trust >= 8 and self.affection >= 8:
-            return "beloved friend"
-        elif self.trust >= 7 and self.affection >= 7:
-            return "trusted ally"
-        elif self.trust >= 7 and self.affection <= 3:
-            return "reliable stranger"
-        elif self.trust <= 3 and self.affection >= 7:
-            return "charming liar"
-        elif self.trust <= 3 and self.affection <= 3:
-            return "dangerous enemy"
-        elif self.trust >= 6 and 4 <= self.affection <= 6:
-            return "cautious ally"
-        elif 4 <= self.trust <= 6 and self.affection >= 7:
-            return "likeable acquaintance"
-        else:
-            return "complicated person"
-    
+        return _derive_label(self.trust, self.affection)
+
     def update_scores(self, trust_delta: int = 0, affection_delta: int = 0):
         """Update relationship scores within bounds"""
         if self.trust is not None:
@@ -60,19 +75,13 @@ class Relationship:
         self.label = self.derive_label()
         
     def add_memory(self, memory: str):
-        """Add a memory of interaction"""
+        """Add a memory of interaction (deque maxlen keeps recent 5)"""
         self.historical_events.append(memory)
-        # Keep only recent 5 memories
-        if len(self.historical_events) > 5:
-            self.historical_events.pop(0)
-            
+
     def add_gossip(self, gossip: str):
-        """Add gossip knowledge about this person"""
+        """Add gossip knowledge about this person (deque maxlen keeps recent 3)"""
         if gossip not in self.gossip_knowledge:
             self.gossip_knowledge.append(gossip)
-        # Keep only recent 3 gossip items
-        if len(self.gossip_knowledge) > 3:
-            self.gossip_knowledge.pop(0)
             
     def establish_first_meeting(self, initial_trust: int = 5, initial_affection: int = 5):
         """Establish relationship on first meeting"""
@@ -145,7 +154,7 @@ class RelationshipMatrix:
             return {
                 "status": "unknown",
                 "label": "stranger",
-                "gossip": rel.gossip_knowledge[-2:] if rel.gossip_knowledge else []
+                "gossip": list(rel.gossip_knowledge)[-2:]
             }
             
         return {
@@ -154,8 +163,8 @@ class RelationshipMatrix:
             "affection": rel.affection,
             "label": rel.label,
             "last_interaction": rel.last_interaction,
-            "recent_memories": rel.historical_events[-3:],
-            "gossip": rel.gossip_knowledge[-2:]
+            "recent_memories": list(rel.historical_events)[-3:],
+            "gossip": list(rel.gossip_knowledge)[-2:]
         }
         
     def get_all_relationships_for(self, character: str) -> Dict[str, Dict[str, Any]]:
@@ -241,8 +250,10 @@ class RelationshipMatrix:
         relationships_dict = {}
         for key, rel in self.relationships.items():
             rel_dict = asdict(rel)
-            # Convert enum to string for JSON serialization
+            # Convert enum and deques to JSON-serializable types
             rel_dict["status"] = rel.status.value
+            rel_dict["historical_events"] = list(rel.historical_events)
+            rel_dict["gossip_knowledge"] = list(rel.gossip_knowledge)
             relationships_dict[key] = rel_dict
             
         return {
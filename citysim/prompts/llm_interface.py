@@ -8,17 +8,28 @@ Now using Together API for cloud-based LLM inference.
 
 import asyncio
 import aiohttp
+import hashlib
 import json
 import logging
+import random
 import re
 import os
 import ssl
-from typing import Dict, Any, Optional, Tuple
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from dotenv import load_dotenv
 import time
 
 from .prompt_builder import PromptBuilder
 
+# orjson parses JSON noticeably faster than the stdlib; fall back
+# silently when it isn't installed (its JSONDecodeError subclasses the
+# stdlib one, so existing except clauses keep working)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -32,6 +43,109 @@ DEFAULT_MODEL = "deepseek-ai/DeepSeek-V3.1"
 # "Qwen/Qwen2.5-72B-Instruct-Turbo"
 # "microsoft/WizardLM-2-8x22B"
 
+
+def _extract_json_block(content: str) -> str:
+    """Extract the JSON payload from a ```json markdown code fence if present"""
+    json_text = content
+    if "```json" in json_text:
+        start = json_text.find("```json") + 7
+        end = json_text.find("```", start)
+        if end != -1:
+            json_text = json_text[start:end].strip()
+    return json_text
+
+# Translation tables for Unicode punctuation that breaks JSON parsing.
+# One str.translate pass replaces the old chain of sequential .replace
+# scans (each of which walked the whole string).
+_QUOTE_TRANSLATION = str.maketrans({
+    "\u201c": '"',   # left double quote
+    "\u201d": '"',   # right double quote
+    "\u2018": "'",   # left single quote
+    "\u2019": "'",   # right single quote
+    "\u201a": "'",   # low single quote
+    "\u201e": '"',   # low double quote
+    "\u201f": '"',   # high reversed double quote
+})
+
+# The turn-response parser is more aggressive: it strips apostrophes
+# entirely and also normalizes ellipses and dashes
+_PARSE_TRANSLATION = str.maketrans({
+    "\u2019": "",    # right single quote - removed
+    "\u2018": "'",   # left single quote
+    "\u201a": "'",   # low single quote
+    "\u201c": '"',   # left double quote
+    "\u201d": '"',   # right double quote
+    "\u201e": '"',   # low double quote
+    "\u201f": '"',   # high reversed double quote
+    "\u2026": "...", # ellipsis
+    "\u2013": "-",   # en dash
+})
+
+def _normalize_quotes(json_text: str) -> str:
+    """Fix Unicode quotes that break JSON parsing (like mafia.py)"""
+    return json_text.translate(_QUOTE_TRANSLATION)
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when available, stdlib json otherwise"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+class LLMCache:
+    """Exact-match LLM response cache keyed on sha256(model + prompt)
+
+    Off by default - live turns should vary - but replaying a scripted
+    scene rebuilds identical prompts, and a hit turns the multi-second
+    API round-trip into a dict lookup.
+    """
+
+    def __init__(self, cache_file: str = "saves/llm_cache.json"):
+        self.cache_file = cache_file
+        self.entries: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        # put() runs on worker threads (asyncio.to_thread) and several
+        # LLM calls can complete at once, so writes must be serialized
+        self._write_lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Load cached responses from disk if present"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r') as f:
+                    self.entries = json.load(f)
+            except Exception:
+                self.entries = {}
+
+    def _save(self):
+        """Persist cached responses to disk (caller holds _write_lock)"""
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        tmp_path = self.cache_file + ".tmp"
+        with open(tmp_path, 'w') as f:
+            # Snapshot so a concurrent get()/put() on another thread
+            # can't mutate the dict mid-dump
+            json.dump(dict(self.entries), f)
+        os.replace(tmp_path, self.cache_file)
+
+    def _key(self, model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """Return the cached response content, or None on a miss"""
+        content = self.entries.get(self._key(model, prompt))
+        if content is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return content
+
+    def put(self, model: str, prompt: str, content: str):
+        """Store a successful response and persist the cache"""
+        with self._write_lock:
+            self.entries[self._key(model, prompt)] = content
+            self._save()
+
 class LLMInterface:
     """Interface for communicating with LLMs"""
     
@@ -75,19 +189,11 @@ class LLMInterface:
         # print("new version")
         try:
             # Extract JSON from markdown code blocks if present
-            json_text = content
-            # print(json_text)
-            if "```json" in json_text:
-                # Extract content between ```json and ```
-                start = json_text.find("```json") + 7
-                end = json_text.find("```", start)
-                if end != -1:
-                    json_text = json_text[start:end].strip()
+            json_text = _extract_json_block(content)
             
-            # Fix all Unicode quotes that break JSON parsing (exactly like mafia.py)
-            json_text = json_text.replace(""", '"').replace(""", '"').replace("'", "'").replace("'", "'")
-            # Also handle smart/curly apostrophes and additional quote variants
-            json_text = json_text.replace("’", "").replace("’", "").replace("‚", "'").replace("„", '"').replace("‟", '"').replace("”",'"').replace("…","...").replace("“",'"').replace("–","-")
+            # Fix all Unicode quotes/punctuation that break JSON parsing
+            # in a single translate pass
+            json_text = json_text.translate(_PARSE_TRANSLATION)
             # More aggressive control character cleaning for JSON strings
             # Replace newlines and tabs in JSON string values with spaces
             json_text = re.sub(r'[\r\n\t]', ' ', json_text)
@@ -98,7 +204,7 @@ class LLMInterface:
             
             # Try to parse the JSON
             try: 
-                loaded_json = json.loads(json_text)
+                loaded_json = _json_loads(json_text)
                 return loaded_json
             except json.JSONDecodeError as parse_error:
                 # Debug information when JSON parsing fails
@@ -127,10 +233,19 @@ class LLMInterface:
             self.logger.warning(f"Failed to parse JSON response: {e}")
             return {}
     
-    def __init__(self, model_name: str = DEFAULT_MODEL):
+    def __init__(self, model_name: str = DEFAULT_MODEL, use_cache: bool = False,
+                 stream: bool = False):
         self.model_name = model_name
         self.prompt_builder = PromptBuilder()
         self.logger = logging.getLogger(__name__)
+
+        # Optional exact-match response cache for replaying scripted scenes
+        self.cache = LLMCache() if use_cache else None
+
+        # Stream responses token-by-token instead of waiting for the full
+        # completion - same content, but the connection fails fast on a
+        # stall instead of sitting out the whole request timeout
+        self.stream = stream
         
         # Together API configuration
         self.api_key = os.getenv("TOGETHER_API_KEY")
@@ -138,12 +253,51 @@ class LLMInterface:
             raise ValueError("TOGETHER_API_KEY not found in environment variables")
         
         self.api_url = "https://api.together.xyz/v1/chat/completions"
-        
+
+        # Request configuration built once - reused for every call
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.timeout = aiohttp.ClientTimeout(total=120)  # 2 minutes
+
+        # Create SSL context that doesn't verify certificates (for development)
+        self.ssl_context = ssl.create_default_context()
+        self.ssl_context.check_hostname = False
+        self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        # Shared HTTP session (created lazily so it binds to the running
+        # event loop) - keeps connections alive across LLM calls instead
+        # of paying a TCP/TLS handshake per call
+        self._session: Optional[aiohttp.ClientSession] = None
+
         # Response tracking
         self.total_calls = 0
         self.total_tokens_estimate = 0
         self.average_response_time = 0.0
-        
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            # A few pooled keep-alive connections cover the gather/prefetch
+            # concurrency; 60s keep-alive spans the gaps between turns so
+            # sockets survive a whole conversation
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(
+                    ssl=self.ssl_context,
+                    limit=8,
+                    keepalive_timeout=60
+                )
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            self._session = None
+
     def set_model(self, model_name: str):
         """Easily change the model being used"""
         self.model_name = model_name
@@ -164,8 +318,9 @@ class LLMInterface:
     async def generate_npc_turn(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate an NPC's conversational turn"""
         prompt = self.prompt_builder.build_turn_prompt(context)
-        
-        self.logger.debug(f"Generated turn prompt ({self.prompt_builder.estimate_tokens(prompt)} tokens)")
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Generated turn prompt ({self.prompt_builder.estimate_tokens(prompt)} tokens)")
         
         response = await self._call_llm(prompt, context.get("personal", {}).get("name", "NPC"))
         
@@ -196,6 +351,36 @@ class LLMInterface:
         else:
             return {"relationships": {}, "knowledge_gained": {"facts": [], "suspicions": [], "gossip_worthy": []}}
             
+    async def generate_batch_reflections(self, contexts: List[Dict[str, Any]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Generate beat reflections for all characters in a single call
+
+        The shared beat context is sent once instead of once per
+        character. Returns character name -> reflection, or None when the
+        combined response doesn't cover every character - callers should
+        fall back to per-character reflection calls.
+        """
+        prompt = self.prompt_builder.build_batch_reflection_prompt(contexts)
+
+        response = await self._call_llm(prompt, "ALL CHARACTERS")
+
+        if not response["success"]:
+            return None
+
+        parsed = self._parse_json_response(response["content"])
+        if not isinstance(parsed, dict):
+            return None
+
+        reflections = {}
+        for context in contexts:
+            name = context.get("personal", {}).get("name", "")
+            entry = parsed.get(name)
+            if not isinstance(entry, dict):
+                self.logger.warning(f"Batch reflection response missing {name} - falling back to per-character calls")
+                return None
+            reflections[name] = self._validate_reflection(entry, name)
+
+        return reflections
+
     async def generate_memory_compression(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate compressed memories for scene end"""
         prompt = self.prompt_builder.build_compression_prompt(context)
@@ -210,21 +395,30 @@ class LLMInterface:
     async def _call_llm(self, prompt: str, character_name: str = "NPC") -> Dict[str, Any]:
         """Make async call to Together API with error handling"""
         start_time = time.time()
-        
-        # Log the prompt (like mafia.py)
-        self.logger.info(f"")
-        self.logger.info(f"{'='*50}")
-        self.logger.info(f"CHARACTER: {character_name.upper()}")
-        self.logger.info(f"{'='*50}")
-        self.logger.info(f"📝 PROMPT:")
-        self.logger.info("-" * 40)
-        self.logger.info(prompt)
-        self.logger.info("-" * 40)
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+
+        # Serve identical prompts from the cache when enabled
+        if self.cache is not None:
+            cached = self.cache.get(self.model_name, prompt)
+            if cached is not None:
+                self.logger.info(f"💾 Cache hit for {character_name} - skipping API call")
+                return {
+                    "success": True,
+                    "content": cached,
+                    "response_time": time.time() - start_time,
+                    "model": self.model_name
+                }
+
+        # Log the prompt (like mafia.py) - skip the formatting entirely when
+        # the log level filters it out anyway
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"")
+            self.logger.info(f"{'='*50}")
+            self.logger.info(f"CHARACTER: {character_name.upper()}")
+            self.logger.info(f"{'='*50}")
+            self.logger.info(f"📝 PROMPT:")
+            self.logger.info("-" * 40)
+            self.logger.info(prompt)
+            self.logger.info("-" * 40)
         
         payload = {
             "model": self.model_name,
@@ -235,51 +429,56 @@ class LLMInterface:
                 }
             ],
             "temperature": 1.05,
-            "stream": False,
+            "stream": self.stream,
             "max_tokens": 1000
         }
         
-        # Use longer timeout and SSL context
-        timeout = aiohttp.ClientTimeout(total=120)  # 2 minutes
-        
-        # Create SSL context that doesn't verify certificates (for development)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        
         try:
-            async with aiohttp.ClientSession(timeout=timeout, connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
-                async with session.post(self.api_url, json=payload, headers=headers) as response:
-                    if response.status == 200:
+            session = self._get_session()
+            async with session.post(self.api_url, json=payload, headers=self.headers) as response:
+                if response.status == 200:
+                    if self.stream:
+                        llm_response = await self._read_stream(response)
+                    else:
                         result = await response.json()
                         llm_response = result.get("choices", [{}])[0].get("message", {}).get("content", "")
                         
-                        # Update statistics
-                        response_time = time.time() - start_time
-                        self._update_stats(prompt, response_time)
+                    # Update statistics
+                    response_time = time.time() - start_time
+                    self._update_stats(prompt, response_time)
                         
-                        # Log raw response (like mafia.py)
-                        if llm_response.strip():
-                            self.logger.info(f"RAW RESPONSE:")
-                            self.logger.info(f"{llm_response.strip()}")
-                        else:
-                            self.logger.warning(f"RAW RESPONSE: [EMPTY - NO OUTPUT FROM MODEL]")
-                        
-                        return {
-                            "success": True,
-                            "content": llm_response,
-                            "response_time": response_time,
-                            "model": self.model_name
-                        }
-                    else:
-                        error_text = await response.text()
-                        self.logger.error(f"🚫 HTTP ERROR {response.status} - {error_text}")
+                    # Log raw response (like mafia.py)
+                    if not llm_response.strip():
+                        self.logger.warning(f"RAW RESPONSE: [EMPTY - NO OUTPUT FROM MODEL]")
+                    elif self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(f"RAW RESPONSE:")
+                        self.logger.info(f"{llm_response.strip()}")
+
+                    if self.cache is not None and llm_response.strip():
+                        # Persist on a worker thread so the cache write
+                        # doesn't stall concurrent LLM calls on the loop.
+                        # A cache failure must never discard the response
+                        # we already have in hand
+                        try:
+                            await asyncio.to_thread(self.cache.put, self.model_name, prompt, llm_response)
+                        except Exception as e:
+                            self.logger.warning(f"Failed to persist LLM cache entry: {e}")
+
+                    return {
+                        "success": True,
+                        "content": llm_response,
+                        "response_time": response_time,
+                        "model": self.model_name
+                    }
+                else:
+                    error_text = await response.text()
+                    self.logger.error(f"🚫 HTTP ERROR {response.status} - {error_text}")
                         
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status}: {error_text}",
-                            "response_time": time.time() - start_time
-                        }
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {error_text}",
+                        "response_time": time.time() - start_time
+                    }
                         
         except asyncio.TimeoutError:
             self.logger.error(f"🚫 CONNECTION TIMEOUT for {character_name}")
@@ -296,6 +495,25 @@ class LLMInterface:
                 "response_time": time.time() - start_time
             }
             
+    async def _read_stream(self, response) -> str:
+        """Accumulate a streamed (SSE) chat completion into one string"""
+        chunks = []
+        async for raw_line in response.content:
+            line = raw_line.decode("utf-8").strip()
+            if not line.startswith("data: "):
+                continue
+            data = line[6:]
+            if data == "[DONE]":
+                break
+            try:
+                delta = _json_loads(data).get("choices", [{}])[0].get("delta", {})
+            except json.JSONDecodeError:
+                continue  # Skip malformed keepalive/partial lines
+            content = delta.get("content")
+            if content:
+                chunks.append(content)
+        return "".join(chunks)
+
     def _update_stats(self, prompt: str, response_time: float):
         """Update LLM call statistics"""
         self.total_calls += 1
@@ -319,16 +537,19 @@ class LLMInterface:
             self.logger.error(f"❌ JSON missing 'speaks' key. Got: {list(response.keys())}")
             return self._fallback_turn_response()
                 
-        # Extract fields like mafia.py
+        # Extract fields like mafia.py - fetch each key once instead of a
+        # membership check followed by a second lookup
         speaks = response["speaks"]
-        conversation_target = None
-        if "conversation_target" in response and response["conversation_target"] != "null":
-            conversation_target = response["conversation_target"]
+        conversation_target = response.get("conversation_target")
+        if conversation_target and conversation_target != "null":
             self.logger.info(f"🎯 TARGET: {conversation_target}")
-            
+        else:
+            conversation_target = None
+
         # Log reasoning if available
-        if "reasoning" in response:
-            self.logger.info(f"🧠 REASONING: {response['reasoning']}")
+        reasoning = response.get("reasoning")
+        if reasoning:
+            self.logger.info(f"🧠 REASONING: {reasoning}")
             
         # Convert to citysim format
         return {
@@ -348,18 +569,11 @@ class LLMInterface:
         """Parse LLM response for interjection decision (with Unicode quote handling)"""
         try:
             # Extract JSON from markdown code blocks if present (like mafia.py)
-            json_text = content.strip()
-            if "```json" in json_text:
-                start = json_text.find("```json") + 7
-                end = json_text.find("```", start)
-                if end != -1:
-                    json_text = json_text[start:end].strip()
+            json_text = _extract_json_block(content.strip())
             
-            # Fix Unicode quotes that break JSON parsing (like mafia.py)
-            json_text = json_text.replace(""", '"').replace(""", '"').replace("'", "'").replace("'", "'")
-            json_text = json_text.replace("'", "'").replace("'", "'").replace("‚", "'").replace("„", '"').replace("‟", '"')
+            json_text = _normalize_quotes(json_text)
             
-            response = json.loads(json_text)
+            response = _json_loads(json_text)
             
             response.setdefault("observation", "listening")
             response.setdefault("wants_to_interject", False)
@@ -382,13 +596,8 @@ class LLMInterface:
             self.logger.warning(f"Failed to parse interjection response: {e}")
             return {"observation": "listening", "wants_to_interject": False}
             
-    def _parse_reflection_response(self, content: str, context: Dict[str, Any] = "None") -> Dict[str, Any]:
-        """Parse LLM response for beat reflection (using unified parser)"""
-        
-        response = self._parse_json_response(content)
-        if not response:  # If parsing failed, return empty structure
-            return {"relationships": {}, "knowledge_gained": {"facts": [], "suspicions": [], "gossip_worthy": []}}
-        
+    def _validate_reflection(self, response: Dict[str, Any], character_name: str) -> Dict[str, Any]:
+        """Fill defaults and drop self-references in a reflection dict"""
         # Set default structure
         response.setdefault("relationships", {})
         response.setdefault("knowledge_gained", {
@@ -396,42 +605,44 @@ class LLMInterface:
             "suspicions": [],
             "gossip_worthy": []
         })
-        
+
         # Validate relationship entries have required fields and remove self-references
         validated_relationships = {}
-        character_name = context.get("personal", {}).get("name", "") if context else ""
-        
+
         for char, rel_data in response["relationships"].items():
             # Skip self-relationships - characters shouldn't reflect on themselves
             if char == character_name:
                 self.logger.warning(f"Ignoring self-relationship entry for {char}")
                 continue
-                
+
             rel_data.setdefault("label", "complicated person")
             rel_data.setdefault("trust_delta", 0)
             rel_data.setdefault("affection_delta", 0)
             rel_data.setdefault("memory", "interacted somehow")
             validated_relationships[char] = rel_data
-            
+
         response["relationships"] = validated_relationships
         return response
+
+    def _parse_reflection_response(self, content: str, context: Dict[str, Any] = "None") -> Dict[str, Any]:
+        """Parse LLM response for beat reflection (using unified parser)"""
+
+        response = self._parse_json_response(content)
+        if not response:  # If parsing failed, return empty structure
+            return {"relationships": {}, "knowledge_gained": {"facts": [], "suspicions": [], "gossip_worthy": []}}
+
+        character_name = context.get("personal", {}).get("name", "") if context else ""
+        return self._validate_reflection(response, character_name)
             
     def _parse_compression_response(self, content: str) -> Dict[str, Any]:
         """Parse LLM response for memory compression (with Unicode quote handling)"""
         try:
             # Extract JSON from markdown code blocks if present (like mafia.py)
-            json_text = content.strip()
-            if "```json" in json_text:
-                start = json_text.find("```json") + 7
-                end = json_text.find("```", start)
-                if end != -1:
-                    json_text = json_text[start:end].strip()
+            json_text = _extract_json_block(content.strip())
             
-            # Fix Unicode quotes that break JSON parsing (like mafia.py)
-            json_text = json_text.replace(""", '"').replace(""", '"').replace("'", "'").replace("'", "'")
-            json_text = json_text.replace("'", "'").replace("'", "'").replace("‚", "'").replace("„", '"').replace("‟", '"')
+            json_text = _normalize_quotes(json_text)
             
-            response = json.loads(json_text)
+            response = _json_loads(json_text)
             
             response.setdefault("specific_memories", [])
             response.setdefault("general_impressions", [])
@@ -460,7 +671,6 @@ class LLMInterface:
             "I need to consider this carefully."
         ]
         
-        import random
         speaks = random.choice(fallback_responses)
         
         return {
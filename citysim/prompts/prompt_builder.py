@@ -8,6 +8,7 @@ Each prompt type uses the same 5 core blocks composed differently.
 
 from typing import Dict, Any, List, Optional
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 class PromptBlock(ABC):
     """Base class for prompt blocks"""
@@ -30,7 +31,7 @@ class PersonalContextBlock(PromptBlock):
             
         learned_section = ""
         if nurture.learned_behaviors:
-            recent_behaviors = nurture.learned_behaviors[-2:]  # Most recent 2
+            recent_behaviors = list(nurture.learned_behaviors)[-2:]  # Most recent 2
             behaviors_list = "\n".join([f"- {behavior}" for behavior in recent_behaviors])
             learned_section = f"""
 
@@ -299,39 +300,31 @@ class ConversationContextBlock(PromptBlock):
             
         return "\n".join(lines)
 
-class PromptInstructionBlock(PromptBlock):
-    """Instructions for how the NPC should respond"""
-    
-    def build_turn_instruction(self, context: Dict[str, Any]) -> str:
-        """Standard speaking turn instruction (like mafia.py)"""
-        personal = context.get("personal", {})
-        scenario = context.get("scenario", {})
-        current_round = context.get("conversation", {}).get("current_round", 1)
-        
-        name = personal.get("name", "Character")
-        
-        round_guidance = ""
-        if current_round >= 6:
-            round_guidance = "- You may want to exit this conversation if it feels resolved"
+@lru_cache(maxsize=128)
+def _build_turn_instruction(name: str, current_round: int) -> str:
+    """Build the turn instruction body for a (character, round) pair"""
+    round_guidance = ""
+    if current_round >= 6:
+        round_guidance = "- You may want to exit this conversation if it feels resolved"
 
-        if current_round >= 4:
-            round_guidance = "- This conversation may end soon - ensure you resolve it"
+    if current_round >= 4:
+        round_guidance = "- This conversation may end soon - ensure you resolve it"
 
-        elif current_round >= 8:
-            round_guidance = "- This conversation should wrap up soon"
+    elif current_round >= 8:
+        round_guidance = "- This conversation should wrap up soon"
 
-        exit_field = ""
-        if current_round >= 4:
-            exit_field = '  ,"wants_to_exit": false  // true if you want to end conversation'
+    exit_field = ""
+    if current_round >= 4:
+        exit_field = '  ,"wants_to_exit": false  // true if you want to end conversation'
 
-        return f"""
+    return f"""
 
 IMPORTANT:
 - You are {name}. You are the main character in a role play. Stay in character.
-- Be natural, fun and conversational, the goal is to build an ENGAGING story. 
-- Use casual speech when interacting with others. 
-- Ensure what you say progresses the conversation forward. Observe the conversation so far to avoid conversation loops at all costs. 
-- You have full freedom in this scene. Investigate, role play, change the subject, interact with the environment, make things up, talk about what happens. 
+- Be natural, fun and conversational, the goal is to build an ENGAGING story.
+- Use casual speech when interacting with others.
+- Ensure what you say progresses the conversation forward. Observe the conversation so far to avoid conversation loops at all costs.
+- You have full freedom in this scene. Investigate, role play, change the subject, interact with the environment, make things up, talk about what happens.
 - You can target someone specific to speak next by mentioning them
 {round_guidance}
 
@@ -345,7 +338,7 @@ Respond with ONLY a JSON object in this format:
   "reasoning": "brief internal reasoning for this response"{exit_field}
 }}
 
-EXAMPLE RESPONSE:  
+EXAMPLE RESPONSE:
 ```json
 {{
 "speaks": "Hmmm, it seems the lock is broken. One second...",
@@ -358,7 +351,22 @@ EXAMPLE RESPONSE:
 ```
 
 Stay true to your character and progress the story. You are the main character"""
-        
+
+class PromptInstructionBlock(PromptBlock):
+    """Instructions for how the NPC should respond"""
+
+    def build_turn_instruction(self, context: Dict[str, Any]) -> str:
+        """Standard speaking turn instruction (like mafia.py)"""
+        personal = context.get("personal", {})
+        current_round = context.get("conversation", {}).get("current_round", 1)
+
+        name = personal.get("name", "Character")
+
+        # The instruction body only varies with name and round, so cache it
+        # instead of rebuilding the large static block every turn
+        return _build_turn_instruction(name, current_round)
+
+
     def build_interjection_instruction(self, context: Dict[str, Any]) -> str:
         """Interjection opportunity instruction"""
         current_speaker = context.get("current_speaker", "someone")
@@ -435,6 +443,49 @@ Required Response Format:
   }}
 }}"""
         
+    def build_batch_reflection_instruction(self, contexts: List[Dict[str, Any]]) -> str:
+        """Combined beat reflection instruction covering several characters"""
+        names = [c.get("personal", {}).get("name", "Unknown") for c in contexts]
+
+        # Build the response skeleton - one top-level entry per character,
+        # each with their own relationships section
+        character_sections = []
+        for context in contexts:
+            name = context.get("personal", {}).get("name", "Unknown")
+            participants = context.get("beat_participants", [])
+            relationships_json = ",\n".join(f"""      "{char}": {{
+        "label": "two words",
+        "trust_delta": number,
+        "affection_delta": number,
+        "memory": "one sentence to describe what is important to remember about this scene for {char}"
+      }}""" for char in participants)
+            character_sections.append(f"""  "{name}": {{
+    "relationships": {{
+{relationships_json}
+    }},
+    "knowledge_gained": {{
+      "gossip_worthy": ["array of gossip, can be null"]
+    }}
+  }}""")
+
+        characters_json = ",\n".join(character_sections)
+
+        return f"""=== PROMPT ===
+Reflect separately AS EACH of the characters described above ({', '.join(names)}).
+
+For each character, considering only what THEY saw and felt:
+- How did their trust in each other character change? (-3 to +3)
+- How did their affection for each other character change? (-3 to +3)
+- Two-word relationship label?
+- What's important for them to remember from this scene?
+
+Keep each character's perspective independent - they do not share thoughts.
+
+Required Response Format:
+{{
+{characters_json}
+}}"""
+
     def build_compression_instruction(self, context: Dict[str, Any]) -> str:
         """Scene memory compression instruction"""
         lines = ["=== PROMPT ==="]
@@ -515,6 +566,20 @@ class PromptBuilder:
         
         return self._compose(sections)
         
+    def build_batch_reflection_prompt(self, contexts: List[Dict[str, Any]]) -> str:
+        """Beat reflections for every character in one prompt - the shared
+        beat summary is included once instead of once per character"""
+        sections = [self.blocks['scenario'].build_beat_summary(contexts[0])]
+
+        for context in contexts:
+            name = context.get("personal", {}).get("name", "Unknown")
+            sections.append(f"=== CHARACTER: {name} ===")
+            sections.append(self.blocks['personal'].build(context))
+            sections.append(self.blocks['relationship'].build_participants(context))
+
+        sections.append(self.blocks['prompt'].build_batch_reflection_instruction(contexts))
+        return self._compose(sections)
+
     def build_compression_prompt(self, context: Dict[str, Any]) -> str:
         """Scene memory compression"""
         sections = [